@@ -13,9 +13,11 @@ class FFNN:
         final_layer=LinearLayer,
         classification=False,
         epochs=1000,
+        batch_size=32,
         learning_rate=0.001,
         lambda_=0,
         verbose=False,
+        seed=None,
     ):
         """Initialize the FFNN
 
@@ -35,12 +37,16 @@ class FFNN:
                 whether the network is a classification problem
             epochs : int
                 number of epochs
+            batch_size : int
+                number of samples in each mini-batch
             learning_rate : float
                 learning rate
             lambda_ : float
                 regularization parameter
             verbose : bool
                 whether to print progress
+            seed : int
+                seed for the random number generator used to initialize the weights
         """
         self.n_inputs = n_inputs
         self.n_categories = n_categories
@@ -48,17 +54,23 @@ class FFNN:
         self.classification = classification
         self.sizes = [self.n_inputs] + list(hidden_sizes) + [self.n_categories]
         self.layers = []
-        self.lambda_ = lambda_
+        # python floats keep the float32 arrays from being upcast in the updates
+        self.lambda_ = float(lambda_)
         self.epochs = epochs
+        self.batch_size = batch_size
         self.verbose = verbose
-        self.learning_rate = learning_rate
+        self.learning_rate = float(learning_rate)
+        self.rng = np.random.default_rng(seed)
 
-        self.layers.append(LinearLayer(1, 1))
         for i in range(len(self.sizes) - 1):
             if i != len(self.sizes) - 1:
-                self.layers.append(hidden_layers(self.sizes[i], self.sizes[i + 1]))
+                self.layers.append(
+                    hidden_layers(self.sizes[i], self.sizes[i + 1], rng=self.rng)
+                )
             else:
-                self.layers.append(final_layer(n_categories, n_categories))
+                self.layers.append(
+                    final_layer(n_categories, n_categories, rng=self.rng)
+                )
 
     def forward(self, x):
         """Forward pass through the network
@@ -66,17 +78,17 @@ class FFNN:
         Parameters
         ----------
             x : numpy.ndarray
-                input data
+                input data, one sample per row
 
         Returns
         -------
             numpy.ndarray
                 predicted values
         """
-        self.layers[0].output = x.reshape(1, -1)
-        for i in range(self.n_hidden_layers + 1):
-            self.layers[i + 1].forward(self.layers[i].output)
-        return self.layers[-1].output
+        output = x
+        for layer in self.layers:
+            output = layer.forward(output)
+        return output
 
     def backward(self, y, learning_rate):
         """Backward pass through the network
@@ -84,24 +96,18 @@ class FFNN:
         Parameters
         ----------
             y : numpy.ndarray
-                target values
+                target values, one sample per row
             learning_rate : float
                 learning rate
         """
-        L = self.n_hidden_layers + 1
-        delta = self.layers[L].output - y
-
-        if self.lambda_ == 0:
-            cost = self.cost(self.layers[L].output, y)
-        else:
-            cost = self.cost_with_regularization(
-                self.layers[L].output, y, lambda_=self.lambda_
-            )
-        self.costs.append(cost)
-
-        for k in range(L, 0, -1):
-            delta = self.layers[k].backward(
-                delta, self.layers[k - 1].output.T, learning_rate, self.lambda_
+        delta = self.layers[-1].output - y
+
+        for layer in reversed(self.layers):
+            delta = layer.backward(
+                delta,
+                learning_rate,
+                self.lambda_,
+                propagate=layer is not self.layers[0],
             )
 
     def fit(self, X, Y):
@@ -114,22 +120,39 @@ class FFNN:
             Y : numpy.ndarray
                 target values
         """
-        self.costs = []
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        Y = np.ascontiguousarray(Y.reshape(len(X), -1), dtype=np.float32)
+        n_batches = max(len(X) // self.batch_size, 1)
+        batches = [
+            slice(indices[0], indices[-1] + 1)
+            for indices in np.array_split(np.arange(len(X)), n_batches)
+        ]
+
+        forward, backward = self.forward, self.backward
+        learning_rate = self.learning_rate
+        rng = self.rng
+
+        self.costs = np.empty(self.epochs)
         for e in (
             tqdm(range(self.epochs), total=self.epochs, unit="epochs")
             if self.verbose
             else range(self.epochs)
         ):
-            for x, y in zip(X, Y):
-                self.forward(x)
-                self.backward(y, learning_rate=self.learning_rate)
-        # group cost by each epoch
-        self.costs = np.sum(
-            np.array(self.costs).reshape(
-                (self.epochs, int(len(self.costs) / self.epochs))
-            ),
-            axis=1,
-        )
+            permutation = rng.permutation(len(X))
+            X_shuffled, Y_shuffled = X[permutation], Y[permutation]
+            for batch in batches:
+                forward(X_shuffled[batch])
+                backward(Y_shuffled[batch], learning_rate)
+
+            Y_pred = forward(X)
+            z = self.layers[-1].z if isinstance(self.layers[-1], SigmoidLayer) else None
+            if self.lambda_ == 0:
+                cost = self.cost(Y_pred, Y, z=z)
+            else:
+                cost = self.cost_with_regularization(
+                    Y_pred, Y, lambda_=self.lambda_, z=z
+                )
+            self.costs[e] = cost
 
     def predict(self, X):
         """Predict the output of the network
@@ -144,15 +167,12 @@ class FFNN:
             numpy.ndarray
                 predicted values
         """
-        Y_pred = []
-        for x in X:
-            y_pred = self.forward(x)
-            Y_pred.append(y_pred)
+        Y_pred = self.forward(np.ascontiguousarray(X, dtype=np.float32)).squeeze()
         if self.classification:
-            return np.array(Y_pred).squeeze() > 0.5
-        return np.array(Y_pred).squeeze()
+            return Y_pred > 0.5
+        return Y_pred
 
-    def cost(self, y_hat, y):
+    def cost(self, y_hat, y, z=None):
         """Calculate the cost of the network
 
         Parameters
@@ -161,6 +181,9 @@ class FFNN:
                 predicted values
             y : numpy.ndarray
                 target values
+            z : numpy.ndarray, optional
+                the logits of a sigmoid output layer, used to compute the
+                cross entropy without taking the log of y_hat
 
         Returns
         -------
@@ -168,13 +191,17 @@ class FFNN:
                 cost
         """
         m = len(y_hat)
-        if self.classification:
+        if self.classification and z is not None:
+            cost = (
+                1 / m * np.sum(np.maximum(z, 0) - z * y + np.log1p(np.exp(-np.abs(z))))
+            )
+        elif self.classification:
             cost = -1 / m * np.nansum(y * np.log(y_hat) + (1 - y) * np.log(1 - y_hat))
         else:
             cost = 1 / m * np.nansum((y - y_hat) ** 2)
         return cost
 
-    def cost_with_regularization(self, y_hat, y, lambda_):
+    def cost_with_regularization(self, y_hat, y, lambda_, z=None):
         """Calculate the cost of the network with regularization
 
         Parameters
@@ -185,6 +212,8 @@ class FFNN:
                 target values
             lambda_ : float
                 regularization parameter
+            z : numpy.ndarray, optional
+                the logits of a sigmoid output layer
 
         Returns
         -------
@@ -192,9 +221,11 @@ class FFNN:
                 cost
         """
         m = len(y_hat)
-        cost = self.cost(y_hat, y)
+        cost = self.cost(y_hat, y, z=z)
         L2_regularization_cost = (
-            lambda_ / (2 * m) * np.nansum(np.square(self.layers[1].weights))
+            lambda_
+            / (2 * m)
+            * sum(np.vdot(layer.weights, layer.weights) for layer in self.layers)
         )
         reg_cost = cost + L2_regularization_cost
         return reg_cost
@@ -90,7 +90,7 @@ def find_optimal_parameters(
                             hidden_layer_sizes=[hidden_layer_size] * hidden_layers,
                             solver="sgd",
                             activation="logistic",
-                            batch_size=1,
+                            batch_size=BATCH_SIZE,
                             alpha=lambda_,
                             learning_rate_init=learning_rate,
                             max_iter=EPOCHS,
@@ -104,6 +104,8 @@ def find_optimal_parameters(
                             epochs=EPOCHS,
                             learning_rate=learning_rate,
                             lambda_=lambda_,
+                            batch_size=BATCH_SIZE,
+                            seed=SEED,
                         )
 
                     net.fit(
@@ -233,6 +235,8 @@ def evaluate_performance_best_parameters(
         learning_rate=learning_rate,
         lambda_=lambda_,
         verbose=True,
+        batch_size=BATCH_SIZE,
+        seed=SEED,
     )
     net.fit(data.X_train, data.z_train)
     line_plot(
@@ -292,6 +296,8 @@ def test_different_hidden_layers(
             learning_rate=learning_rate,
             lambda_=lambda_,
             verbose=True,
+            batch_size=BATCH_SIZE,
+            seed=SEED,
         )
 
         net.fit(
@@ -1,4 +1,5 @@
 import numpy as np
+from joblib import Parallel, delayed
 from generate_data import BreastCancerData
 
 from logistic_regression import LogisticRegression
@@ -14,6 +15,34 @@ def accuracy_score_numpy(Y_test, Y_pred):
     return np.sum(Y_test == Y_pred) / len(Y_test)
 
 
+def fit_and_predict(data, learning_rate, lmb):
+    """Fits a logistic regression model and predicts the test data
+
+    Parameters
+    ----------
+        data : BreastCancerData
+            The data to fit and predict
+        learning_rate : float
+            The learning rate
+        lmb : float
+            The regularization parameter
+
+    Returns
+    -------
+        numpy.ndarray
+            The predicted output for the test data
+    """
+    logistic = LogisticRegression()
+    logistic.fit(
+        data.X_train,
+        data.z_train,
+        alpha=learning_rate,
+        iterations=10_000,
+        lambda_=lmb,
+    )
+    return logistic.predict(data.X_test)
+
+
 def main():
     data = BreastCancerData(test_size=0.2, scale_data=True)
 
@@ -35,48 +64,41 @@ def main():
     learning_rates = np.logspace(-4, 2, N)
     lambdas = np.logspace(-4, 4, N)
 
-    np.random.seed(42)
-
-    logistic = LogisticRegression()
-
-    for learning_rate in learning_rates:
-        for lmb in lambdas:
-            logistic.fit(
-                data.X_train,
-                data.z_train,
-                alpha=learning_rate,
-                iterations=10_000,
-                lambda_=lmb,
-            )
+    grid = [(learning_rate, lmb) for learning_rate in learning_rates for lmb in lambdas]
+    predictions = Parallel(n_jobs=-1)(
+        delayed(fit_and_predict)(data, learning_rate, lmb)
+        for learning_rate, lmb in grid
+    )
 
-            prediction_log_reg = logistic.predict(data.X_test) < 0.5
+    for (learning_rate, lmb), prediction in zip(grid, predictions):
+        prediction_log_reg = prediction < 0.5
 
-            true_output = data.z_test < 0.5
+        true_output = data.z_test < 0.5
 
-            accuracy = accuracy_score_numpy(true_output, prediction_log_reg)
-            score = np.mean(prediction_log_reg == true_output)
-            dict_accuracy[(learning_rate, lmb)] = score
+        accuracy = accuracy_score_numpy(true_output, prediction_log_reg)
+        score = np.mean(prediction_log_reg == true_output)
+        dict_accuracy[(learning_rate, lmb)] = score
 
-            tn_fp, fn_tp = confusion_matrix(true_output, prediction_log_reg)
-            tn, fp = tn_fp
-            fn, tp = fn_tp
-            total_nbr_obs = len(true_output)
-            dict_tn[(learning_rate, lmb)] = tn / total_nbr_obs * 100
-            dict_fp[(learning_rate, lmb)] = fp / total_nbr_obs * 100
-            dict_fn[(learning_rate, lmb)] = fn / total_nbr_obs * 100
-            dict_tp[(learning_rate, lmb)] = tp / total_nbr_obs * 100
+        tn_fp, fn_tp = confusion_matrix(true_output, prediction_log_reg)
+        tn, fp = tn_fp
+        fn, tp = fn_tp
+        total_nbr_obs = len(true_output)
+        dict_tn[(learning_rate, lmb)] = tn / total_nbr_obs * 100
+        dict_fp[(learning_rate, lmb)] = fp / total_nbr_obs * 100
+        dict_fn[(learning_rate, lmb)] = fn / total_nbr_obs * 100
+        dict_tp[(learning_rate, lmb)] = tp / total_nbr_obs * 100
 
-            ppv = tp / (tp + fp) * 100
-            dict_ppv[(learning_rate, lmb)] = ppv
+        ppv = tp / (tp + fp) * 100
+        dict_ppv[(learning_rate, lmb)] = ppv
 
-            npv = tn / (tn + fn) * 100
-            dict_npv[(learning_rate, lmb)] = npv
+        npv = tn / (tn + fn) * 100
+        dict_npv[(learning_rate, lmb)] = npv
 
-            dict_sensitivity[(learning_rate, lmb)] = tp / (tp + fn) * 100
-            dict_specificity[(learning_rate, lmb)] = tn / (tn + fp) * 100
+        dict_sensitivity[(learning_rate, lmb)] = tp / (tp + fn) * 100
+        dict_specificity[(learning_rate, lmb)] = tn / (tn + fp) * 100
 
-            F1_score = tp / (tp + 0.5 * (fp + fn))
-            dict_F1_score[(learning_rate, lmb)] = F1_score
+        F1_score = tp / (tp + 0.5 * (fp + fn))
+        dict_F1_score[(learning_rate, lmb)] = F1_score
 
     print(f"dict_accuracy = {dict_accuracy}")
     print(f"dict_tn = {dict_tn}")
@@ -352,6 +374,7 @@ def main():
     plt.show()
 
     """ Making a confusion matrix for the  learning rates and lambdas that give optimal F1 score"""
+    logistic = LogisticRegression()
     logistic.fit(
         data.X_train,
         data.z_train,
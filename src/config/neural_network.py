@@ -2,6 +2,7 @@
 N_HIDDEN_NEURONS = 50
 N_CATEGORIES = 10
 EPOCHS = 10
-BATCH_SIZE = 100
+BATCH_SIZE = 32
 ETA = 0.1
 LAMBDA_ = 0.0
+SEED = 42
@@ -1,24 +1,35 @@
 import numpy as np
+from scipy.special import expit
 
 
 class Layer:
-    def __init__(self, n_inputs, n_neurons, activation):
-        self.weights = np.random.randn(n_inputs, n_neurons) * 0.5
-        self.bias = np.zeros((1, n_neurons))
+    def __init__(self, n_inputs, n_neurons, activation, rng=None):
+        if rng is None:
+            rng = np.random.default_rng()
+        self.weights = rng.standard_normal((n_inputs, n_neurons), dtype=np.float32)
+        self.weights *= 0.5
+        self.bias = np.zeros((1, n_neurons), dtype=np.float32)
         self.activation = activation
 
     def forward(self, inputs):
         self.inputs = inputs
-        self.output = self.activation(np.matmul(inputs, self.weights) + self.bias)
+        self.z = np.matmul(inputs, self.weights) + self.bias
+        self.output = self.activation(self.z)
         return self.output
 
-    def backward(self, delta, output_transposed, learning_rate, lambda_=0):
-        delta_weights = np.matmul(output_transposed, delta) + lambda_ * self.weights
-        delta_bias = delta
+    def backward(self, delta, learning_rate, lambda_=0, propagate=True):
+        batch_size = len(delta)
+        delta_weights = (
+            np.matmul(self.inputs.T, delta) / batch_size + lambda_ * self.weights
+        )
+        delta_bias = np.mean(delta, axis=0, keepdims=True)
 
         self.weights -= delta_weights * learning_rate
         self.bias -= delta_bias * learning_rate
 
+        if not propagate:
+            return None
+
         delta = np.matmul(delta, self.weights.T) * self.activation(
             self.inputs, derivative=True
         )
@@ -33,8 +44,8 @@ class Layer:
 
 
 class LinearLayer(Layer):
-    def __init__(self, n_inputs, n_neurons):
-        super().__init__(n_inputs, n_neurons, self.linear)
+    def __init__(self, n_inputs, n_neurons, rng=None):
+        super().__init__(n_inputs, n_neurons, self.linear, rng=rng)
 
     def linear(self, x, derivative=False):
         if derivative:
@@ -46,27 +57,27 @@ class LinearLayer(Layer):
 
 
 class SigmoidLayer(Layer):
-    def __init__(self, n_inputs, n_neurons):
-        super().__init__(n_inputs, n_neurons, self.sigmoid)
+    def __init__(self, n_inputs, n_neurons, rng=None):
+        super().__init__(n_inputs, n_neurons, self.sigmoid, rng=rng)
 
     def sigmoid(self, x, derivative=False):
         if derivative:
             return x * (1 - x)
-        return 1 / (1 + np.exp(-x))
+        return expit(x)
 
     def __name__(self):
         return "SigmoidLayer"
 
 
 class LeakyReluLayer(Layer):
-    def __init__(self, n_inputs, n_neurons, c=0.01):
-        super().__init__(n_inputs, n_neurons, self.leaky_relu)
+    def __init__(self, n_inputs, n_neurons, c=0.01, rng=None):
+        super().__init__(n_inputs, n_neurons, self.leaky_relu, rng=rng)
 
         self.c = c
 
     def leaky_relu(self, x, derivative=False):
         if derivative:
-            return np.where(x > 0, 1, self.c)
+            return np.where(x > 0, 1, self.c).astype(x.dtype)
 
         return np.maximum(x, self.c * x)
 
@@ -75,8 +86,8 @@ class LeakyReluLayer(Layer):
 
 
 class ReluLayer(LeakyReluLayer):
-    def __init__(self, n_inputs, n_neurons):
-        super().__init__(n_inputs, n_neurons, 0)
+    def __init__(self, n_inputs, n_neurons, rng=None):
+        super().__init__(n_inputs, n_neurons, 0, rng=rng)
 
     def __name__(self):
         return "ReluLayer"
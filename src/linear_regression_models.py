@@ -44,7 +44,6 @@ class LinearRegression(object):
             beta : np.array
                 The fitted beta values
         """
-        get_grad = grad(self.loss_function, argnum=2)
         beta = np.random.randn(X.shape[1], 1)
         n_inputs = len(z)
         data_indices = np.arange(n_mini_batches)
@@ -60,9 +59,11 @@ class LinearRegression(object):
                 z_batch = z[chosen_datapoints_indexes]
 
                 if hasattr(self, "lambda_"):
-                    grad_beta = get_grad(X_batch, z_batch, beta, self.lambda_)
+                    grad_beta = self.loss_function_gradient(
+                        X_batch, z_batch, beta, self.lambda_
+                    )
                 else:
-                    grad_beta = get_grad(X_batch, z_batch, beta)
+                    grad_beta = self.loss_function_gradient(X_batch, z_batch, beta)
 
                 eta = self.learning_schedule(k) * learning_multiplier
                 beta_new = beta - eta * grad_beta
@@ -136,6 +137,27 @@ class LinearRegression(object):
         """
         raise NotImplementedError("TODO: Not implemented message")
 
+    def loss_function_gradient(self, X, z, beta, *args):
+        """The gradient of the loss function with respect to beta, found using autograd
+
+        Parameters
+        ----------
+            X : np.array
+                The X values for which to calculate the gradient
+            z : np.array
+                The z values for which to calculate the gradient
+            beta : np.array
+                The beta values for which to calculate the gradient
+            *args
+                Additional arguments passed on to the loss function
+
+        Returns
+        -------
+            gradient : np.array
+                The gradient of the loss function with respect to beta
+        """
+        return grad(self.loss_function, argnum=2)(X, z, beta, *args)
+
     def confidence_intervals(self, *_):
         """Abstract method for getting the confidence interval for a model
 
@@ -1,11 +1,12 @@
 import numpy as np
+from scipy.special import expit
 
 
 class LogisticRegression:
     def __init__(self):
         pass
 
-    def cost_function_gradient(self, X, y, lambda_):
+    def cost_function_gradient(self, X, y, lambda_, X_T=None):
         """Compute the gradient of the cost function
 
         Parameters
@@ -16,6 +17,8 @@ class LogisticRegression:
                 The target data
             lambda_ : float
                 The regularization parameter
+            X_T : numpy.ndarray, optional
+                A precomputed transpose of X
 
         Returns
         -------
@@ -24,7 +27,9 @@ class LogisticRegression:
         """
         m = len(y)
         h = self.h(X, self.theta)
-        gradient = (1 / m) * np.dot(X.T, h - y)
+        if X_T is None:
+            X_T = X.T
+        gradient = (1 / m) * np.dot(X_T, h - y)
         if lambda_:
             gradient += (lambda_ / m) * self.theta
         return gradient
@@ -50,8 +55,9 @@ class LogisticRegression:
             numpy.ndarray
                 The optimal values for theta
         """
+        X_T = np.ascontiguousarray(X.T)
         for _ in range(iterations):
-            gradient = self.cost_function_gradient(X, y, lambda_=lambda_)
+            gradient = self.cost_function_gradient(X, y, lambda_=lambda_, X_T=X_T)
             self.theta = self.theta - alpha * gradient
         return self.theta
 
@@ -103,7 +109,7 @@ class LogisticRegression:
             numpy.ndarray
                 The value with a sigmoid function applied
         """
-        return 1 / (1 + np.exp(-z))
+        return expit(z)
 
     @staticmethod
     def h(X, theta):
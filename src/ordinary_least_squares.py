@@ -1,8 +1,6 @@
-import autograd.numpy as np
-from autograd import grad
-
-#  import numpy as np
+import numpy as np
 from scipy import stats
+from scipy.linalg import solve_triangular
 from linear_regression_models import LinearRegression
 
 
@@ -27,9 +25,9 @@ class OrdinaryLeastSquares(LinearRegression):
             z : np.array
                 The z values for which to fit the model
         """
-        hessian = X.T @ X
-        hessian_inv = np.linalg.pinv(hessian)
-        self.beta = hessian_inv @ X.T @ z
+        # solving R beta = Q^T z avoids forming and inverting X^T X
+        Q, R = np.linalg.qr(X)
+        self.beta = solve_triangular(R, Q.T @ z)
 
     def loss_function(self, X, z, beta):
         """Returns the loss function for the model
@@ -51,6 +49,25 @@ class OrdinaryLeastSquares(LinearRegression):
         loss = np.mean((z.reshape(-1, 1) - X @ beta) ** 2)
         return loss
 
+    def loss_function_gradient(self, X, z, beta):
+        """Returns the analytical gradient of the loss function with respect to beta
+
+        Parameters
+        ----------
+            X : np.array
+                The X values for which to calculate the gradient
+            z : np.array
+                The z values for which to calculate the gradient
+            beta : np.array
+                The beta values for which to calculate the gradient
+
+        Returns
+        -------
+            gradient : np.array
+                The gradient of the loss function with respect to beta
+        """
+        return 2 / len(z) * X.T @ (X @ beta - z.reshape(-1, 1))
+
     def confidence_intervals(self, X, z, z_tilde, alpha=0.05):
         """Calculates the confidence interval for each beta value
 
@@ -77,9 +94,11 @@ class OrdinaryLeastSquares(LinearRegression):
         N = len(z_tilde)
         Z = stats.norm.ppf(1 - alpha / 2)
         sigma_squared = 1 / (N - len(self.beta) - 1) * np.sum((z - z_tilde) ** 2)
-        hessian = X.T @ X
-        hessian_inv = np.linalg.pinv(hessian)
-        sigma_betas = sigma_squared * np.sqrt(hessian_inv.diagonal())
+        # (X^T X)^-1 = R^-1 R^-T
+        R = np.linalg.qr(X, mode="r")
+        R_inv = solve_triangular(R, np.identity(len(R)))
+        hessian_inv_diagonal = np.sum(R_inv ** 2, axis=1)
+        sigma_betas = sigma_squared * np.sqrt(hessian_inv_diagonal)
         confidence_intervals = (
             self.beta - Z * sigma_betas,
             self.beta + Z * sigma_betas,